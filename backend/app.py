@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 from dotenv import load_dotenv
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 
 # Load environment variables
 load_dotenv()
@@ -37,6 +38,9 @@ db = DatabaseConfig()  # This now initializes the connection pool automatically
 predictor = EnergyPredictor(model_path='../ml_models/models')
 visualizer = EnergyVisualizer(output_dir='../frontend/static/plots')
 
+# Seconds a request waits for its plot on the visualizer's render thread
+PLOT_RENDER_TIMEOUT = 30
+
 # Verify connection pool is ready
 if db.connection_pool:
     print("✓ Connection pool ready with 10 connections")
@@ -55,6 +59,18 @@ def calculate_carbon_footprint(kwh):
     return kwh * CO2_PER_KWH
 
 
+def wait_for_plot(future):
+    """
+    Wait up to PLOT_RENDER_TIMEOUT for a plot queued on the visualizer's render thread
+    A plot that has not started by then is cancelled so the thread skips it
+    """
+    try:
+        return future.result(timeout=PLOT_RENDER_TIMEOUT)
+    except FuturesTimeoutError:
+        future.cancel()
+        raise
+
+
 def generate_insights(user_id, daily_data, appliance_data):
     """Generate personalized energy-saving insights"""
     insights = []
@@ -653,7 +669,8 @@ def visualize_daily():
         print(f"DataFrame columns: {df.columns.tolist()}")  # Debug
         
         return_base64 = (format_type == 'base64')
-        result = visualizer.plot_daily_consumption(df, days=days, return_base64=return_base64)
+        future = visualizer.async_plot_daily_consumption(df, days=days, return_base64=return_base64)
+        result = wait_for_plot(future)
         
         print(f"Visualization result: {result[:100] if result else 'None'}...")  # Debug
         
@@ -662,6 +679,8 @@ def visualize_daily():
         else:
             return jsonify({'filepath': result}), 200
             
+    except FuturesTimeoutError:
+        return jsonify({'error': 'Chart rendering timed out, please try again'}), 504
     except Exception as e:
         print(f"Error in visualize_daily: {str(e)}")  # Debug
         import traceback
@@ -691,7 +710,8 @@ def visualize_appliances():
         print(f"DataFrame columns: {df.columns.tolist()}")  # Debug
         
         return_base64 = (format_type == 'base64')
-        result = visualizer.plot_appliance_breakdown(df, return_base64=return_base64)
+        future = visualizer.async_plot_appliance_breakdown(df, return_base64=return_base64)
+        result = wait_for_plot(future)
         
         print(f"Visualization result: {result[:100] if result else 'None'}...")  # Debug
         
@@ -700,6 +720,8 @@ def visualize_appliances():
         else:
             return jsonify({'filepath': result}), 200
             
+    except FuturesTimeoutError:
+        return jsonify({'error': 'Chart rendering timed out, please try again'}), 504
     except Exception as e:
         print(f"Error in visualize_appliances: {str(e)}")  # Debug
         import traceback
@@ -723,13 +745,16 @@ def visualize_energy_consumption():
         
         df = pd.DataFrame(daily_data)
         return_base64 = (format_type == 'base64')
-        result = visualizer.plot_energy_consumption_only(df, days=days, return_base64=return_base64)
+        future = visualizer.async_plot_energy_consumption_only(df, days=days, return_base64=return_base64)
+        result = wait_for_plot(future)
         
         if return_base64:
             return jsonify({'image': result}), 200
         else:
             return jsonify({'filepath': result}), 200
             
+    except FuturesTimeoutError:
+        return jsonify({'error': 'Chart rendering timed out, please try again'}), 504
     except Exception as e:
         print(f"Error in visualize_energy_consumption: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -751,13 +776,16 @@ def visualize_cost_analysis():
         
         df = pd.DataFrame(daily_data)
         return_base64 = (format_type == 'base64')
-        result = visualizer.plot_cost_analysis_only(df, days=days, return_base64=return_base64)
+        future = visualizer.async_plot_cost_analysis_only(df, days=days, return_base64=return_base64)
+        result = wait_for_plot(future)
         
         if return_base64:
             return jsonify({'image': result}), 200
         else:
             return jsonify({'filepath': result}), 200
             
+    except FuturesTimeoutError:
+        return jsonify({'error': 'Chart rendering timed out, please try again'}), 504
     except Exception as e:
         print(f"Error in visualize_cost_analysis: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -778,13 +806,16 @@ def visualize_appliance_bar():
         
         df = pd.DataFrame(appliance_data)
         return_base64 = (format_type == 'base64')
-        result = visualizer.plot_appliance_bar_only(df, return_base64=return_base64)
+        future = visualizer.async_plot_appliance_bar_only(df, return_base64=return_base64)
+        result = wait_for_plot(future)
         
         if return_base64:
             return jsonify({'image': result}), 200
         else:
             return jsonify({'filepath': result}), 200
             
+    except FuturesTimeoutError:
+        return jsonify({'error': 'Chart rendering timed out, please try again'}), 504
     except Exception as e:
         print(f"Error in visualize_appliance_bar: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -805,13 +836,16 @@ def visualize_appliance_pie():
         
         df = pd.DataFrame(appliance_data)
         return_base64 = (format_type == 'base64')
-        result = visualizer.plot_appliance_pie_only(df, return_base64=return_base64)
+        future = visualizer.async_plot_appliance_pie_only(df, return_base64=return_base64)
+        result = wait_for_plot(future)
         
         if return_base64:
             return jsonify({'image': result}), 200
         else:
             return jsonify({'filepath': result}), 200
             
+    except FuturesTimeoutError:
+        return jsonify({'error': 'Chart rendering timed out, please try again'}), 504
     except Exception as e:
         print(f"Error in visualize_appliance_pie: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -834,13 +868,16 @@ def visualize_monthly():
         df = pd.DataFrame(monthly_data)
         
         return_base64 = (format_type == 'base64')
-        result = visualizer.plot_monthly_trend(df, months=months, return_base64=return_base64)
+        future = visualizer.async_plot_monthly_trend(df, months=months, return_base64=return_base64)
+        result = wait_for_plot(future)
         
         if return_base64:
             return jsonify({'image': result}), 200
         else:
             return jsonify({'filepath': result}), 200
             
+    except FuturesTimeoutError:
+        return jsonify({'error': 'Chart rendering timed out, please try again'}), 504
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -871,13 +908,16 @@ def visualize_hourly_pattern():
         
         df = pd.DataFrame(hourly_data)
         return_base64 = (format_type == 'base64')
-        result = visualizer.plot_hourly_pattern(df, return_base64=return_base64)
+        future = visualizer.async_plot_hourly_pattern(df, return_base64=return_base64)
+        result = wait_for_plot(future)
         
         if return_base64:
             return jsonify({'image': result}), 200
         else:
             return jsonify({'filepath': result}), 200
             
+    except FuturesTimeoutError:
+        return jsonify({'error': 'Chart rendering timed out, please try again'}), 504
     except Exception as e:
         print(f"Error in visualize_hourly_pattern: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -923,13 +963,16 @@ def visualize_weekly_comparison():
             weekly_data.columns = ['day_name', 'avg_kwh', 'total_cost']
         
         return_base64 = (format_type == 'base64')
-        result = visualizer.plot_weekly_comparison(weekly_data, return_base64=return_base64)
+        future = visualizer.async_plot_weekly_comparison(weekly_data, return_base64=return_base64)
+        result = wait_for_plot(future)
         
         if return_base64:
             return jsonify({'image': result}), 200
         else:
             return jsonify({'filepath': result}), 200
             
+    except FuturesTimeoutError:
+        return jsonify({'error': 'Chart rendering timed out, please try again'}), 504
     except Exception as e:
         print(f"Error in visualize_weekly_comparison: {str(e)}")
         import traceback
@@ -952,13 +995,16 @@ def visualize_appliance_efficiency():
         
         df = pd.DataFrame(appliance_data)
         return_base64 = (format_type == 'base64')
-        result = visualizer.plot_appliance_efficiency(df, return_base64=return_base64)
+        future = visualizer.async_plot_appliance_efficiency(df, return_base64=return_base64)
+        result = wait_for_plot(future)
         
         if return_base64:
             return jsonify({'image': result}), 200
         else:
             return jsonify({'filepath': result}), 200
             
+    except FuturesTimeoutError:
+        return jsonify({'error': 'Chart rendering timed out, please try again'}), 504
     except Exception as e:
         print(f"Error in visualize_appliance_efficiency: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -1018,13 +1064,16 @@ def visualize_appliance_usage_timeline():
             timeline_df = pd.DataFrame(timeline_data)
         
         return_base64 = (format_type == 'base64')
-        result = visualizer.plot_appliance_usage_timeline(timeline_df, return_base64=return_base64)
+        future = visualizer.async_plot_appliance_usage_timeline(timeline_df, return_base64=return_base64)
+        result = wait_for_plot(future)
         
         if return_base64:
             return jsonify({'image': result}), 200
         else:
             return jsonify({'filepath': result}), 200
             
+    except FuturesTimeoutError:
+        return jsonify({'error': 'Chart rendering timed out, please try again'}), 504
     except Exception as e:
         print(f"Error in visualize_appliance_usage_timeline: {str(e)}")
         import traceback
@@ -5,40 +5,305 @@ Creates charts and graphs for energy consumption analysis
 
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend for Flask
-import matplotlib.pyplot as plt
-import seaborn as sns
+import matplotlib.style
+import matplotlib.colors as mcolors
+import matplotlib.dates as mdates
+from matplotlib import colormaps, font_manager
+from matplotlib.artist import setp
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.text import Text
+from matplotlib.collections import PatchCollection
+from matplotlib.patches import FancyBboxPatch, Wedge
+from PIL import Image
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 from datetime import datetime, timedelta
+import functools
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import hashlib
+import inspect
 import os
+import shutil
+import tempfile
 import io
 import base64
+import threading
+import weakref
 
-# Set style with even larger fonts for better readability
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (16, 10)
-plt.rcParams['font.size'] = 16
-plt.rcParams['axes.labelsize'] = 20
-plt.rcParams['axes.titlesize'] = 24
-plt.rcParams['xtick.labelsize'] = 16
-plt.rcParams['ytick.labelsize'] = 16
-plt.rcParams['legend.fontsize'] = 16
-plt.rcParams['figure.titlesize'] = 26
+# Plot theme (whitegrid look with even larger fonts for better readability).
+# Applied per render through matplotlib.style.context so the process-wide
+# rcParams stay at their defaults
+ENERGY_STYLE = {
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'axes.facecolor': 'white',
+    'axes.edgecolor': '#cccccc',
+    'grid.alpha': 0.3,
+    'grid.color': '#cccccc',
+    'patch.edgecolor': 'white',
+    'patch.force_edgecolor': True,
+    'figure.figsize': (16, 10),
+    'font.size': 16,
+    'axes.labelsize': 20,
+    'axes.titlesize': 24,
+    'xtick.labelsize': 16,
+    'ytick.labelsize': 16,
+    'legend.fontsize': 16,
+    'figure.titlesize': 26,
+    # Pin a single font so text artists skip the fallback chain
+    'font.family': 'DejaVu Sans',
+    'font.sans-serif': ['DejaVu Sans'],
+    # Let Agg drop near-collinear vertices before rasterizing paths
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+}
+
+# Build the font cache now rather than on the first request
+font_manager.findfont('DejaVu Sans')
+
+MONTH_ABBR = np.array(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                       'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+# Monday-first, matching dt.dayofweek; codes 5 and 6 are the weekend
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+# Raster size of the efficiency bars: image rows per bar (0.8 of each row is
+# filled) and columns across the widest bar
+BAR_ROWS = 10
+BAR_RASTER_WIDTH = 1024
+# Tallest efficiency chart in inches; Agg refuses images past 2**16 pixels,
+# and rows beyond this just get thinner
+MAX_EFFICIENCY_HEIGHT = 60
+
+
+def _conf_bounds(x, lo, hi):
+    """Fill lo/hi in place with the ±10% prediction band around x"""
+    np.multiply(x, 0.9, out=lo)
+    np.multiply(x, 1.1, out=hi)
+
+
+def _df_fingerprint(df, cols):
+    """
+    Digest the given DataFrame columns by the bytes of their numpy buffers
+    
+    Args:
+        df: Source DataFrame
+        cols: Column names to include
+    
+    Returns:
+        16-byte digest
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for c in cols:
+        values = df[c].to_numpy()
+        h.update(f'{c}:{values.dtype.str}:{values.size};'.encode())
+        if values.dtype.kind == 'O':
+            # Object buffers hold pointers, so hash Decimal/str cells by value
+            values = pd.util.hash_pandas_object(df[c], index=False).to_numpy()
+        h.update(np.ascontiguousarray(values).tobytes())
+    return h.digest()
+
+
+# Salt for on-disk render cache names: the code and matplotlib that drew them
+with open(__file__, 'rb') as _source:
+    _RENDER_SALT = hashlib.blake2b(_source.read() + matplotlib.__version__.encode(), digest_size=16).digest()
+
+
+def _fingerprint(values):
+    """Digest plot arguments by content, hashing DataFrames column by column"""
+    h = hashlib.blake2b(digest_size=16)
+    for value in values:
+        if isinstance(value, pd.DataFrame):
+            h.update(_df_fingerprint(value, list(value.columns)))
+        else:
+            h.update(repr(value).encode())
+    return h.digest()
+
+
+def _memoized_render(method):
+    """
+    Route a plot method through EnergyVisualizer._cached_render
+    
+    The key covers the method name, the output mode and format (from the
+    save_as extension) and the content of every other argument (including
+    days/top_n), so a dashboard refresh with unchanged data skips matplotlib
+    entirely.
+    """
+    signature = inspect.signature(method)
+    
+    def render_key(self, *args, **kwargs):
+        """Return (key, save_as, return_base64) for a call"""
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        del params['self']
+        return_base64 = bool(params.pop('return_base64'))
+        save_as = params.pop('save_as')
+        # The file format follows save_as's extension (data URIs are always PNG)
+        fmt = 'png' if return_base64 else os.path.splitext(save_as)[1][1:].lower() or 'png'
+        key = (method.__name__, return_base64, _fingerprint(list(params.values())), fmt)
+        return key, save_as, return_base64
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key, save_as, return_base64 = render_key(self, *args, **kwargs)
+        
+        def build():
+            # Agg is only safe when one figure is drawn at a time
+            with self._render_lock:
+                return method(self, *args, **kwargs)
+        
+        return self._cached_render(key, build, save_as, return_base64)
+    
+    wrapper.render_key = render_key
+    return wrapper
+
+
+def _energy_style(method):
+    """Render a plot method inside the ENERGY_STYLE theme"""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with matplotlib.style.context(ENERGY_STYLE):
+            return method(*args, **kwargs)
+    
+    return wrapper
+
+
+@functools.lru_cache(maxsize=128)
+def _hue_palette(n):
+    """Evenly spaced HSV hues as a read-only (n, 3) RGB array, cached by n"""
+    hues = np.linspace(0, 1, n, endpoint=False)
+    palette = mcolors.hsv_to_rgb(np.stack([hues, np.full_like(hues, 0.75), np.full_like(hues, 0.85)], axis=1))
+    palette.setflags(write=False)
+    return palette
+
+
+# RdYlGn_r lookup table as 8-bit RGBA and matching hex strings, built once;
+# integer input indexes a colormap's 256-entry table directly
+_RDYLGN_U8 = np.round(colormaps['RdYlGn_r'](np.arange(256)) * 255).astype(np.uint8)
+_RDYLGN_U8.setflags(write=False)
+_RDYLGN_HEX = ['#%02x%02x%02x' % tuple(rgba[:3]) for rgba in _RDYLGN_U8.tolist()]
+
+
+@functools.lru_cache(maxsize=128)
+def _rdylgn_indices(n, lo, hi):
+    """Table indices of n RdYlGn_r samples between lo and hi (as Colormap.__call__ picks them)"""
+    idx = np.minimum((np.linspace(lo, hi, n) * 256).astype(np.int64), 255)
+    idx.setflags(write=False)
+    return idx
+
+
+@functools.lru_cache(maxsize=128)
+def _rdylgn_gradient(n, lo, hi):
+    """n RdYlGn_r hex colors between lo and hi, cached"""
+    return tuple(_RDYLGN_HEX[i] for i in _rdylgn_indices(n, lo, hi))
+
+
+def _top_k_desc(values, k):
+    """
+    Indices of the k largest values, largest first
+    
+    Picks and orders rows like a stable descending sort cut to k (ties keep
+    input order, NaN sorts last), but partitions in O(n) and only sorts the
+    rows that are kept.
+    
+    Args:
+        values: 1-D float array
+        k: Number of indices to return (None for all)
+    
+    Returns:
+        Integer index array
+    """
+    rank = np.where(np.isnan(values), np.inf, -values)
+    k = rank.size if k is None else max(0, min(k, rank.size))
+    if k == rank.size:
+        return np.argsort(rank, kind='stable')
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    kth = np.partition(rank, k - 1)[k - 1]
+    below = np.flatnonzero(rank < kth)
+    ties = np.flatnonzero(rank == kth)[:k - below.size]
+    idx = np.sort(np.concatenate([below, ties]))
+    return idx[np.argsort(rank[idx], kind='stable')]
+
+
+def _lttb_indices(x, y, target):
+    """
+    Pick indices of a Largest-Triangle-Three-Buckets downsample of (x, y)
+    
+    Args:
+        x: Monotonic float64 x values
+        y: Float64 y values
+        target: Number of points to keep (at least 3)
+    
+    Returns:
+        Sorted integer index array of length target
+    """
+    n = y.size
+    idx = np.empty(target, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    # Bucket edges for the n - 2 interior points
+    edges = (np.arange(target - 1) * (n - 2) / (target - 2)).astype(np.int64) + 1
+    edges[-1] = n - 1
+    a = 0
+    for i in range(target - 2):
+        start, end = edges[i], edges[i + 1]
+        nxt_end = edges[i + 2] if i + 2 < target - 1 else n
+        avg_x = x[end:nxt_end].mean()
+        avg_y = y[end:nxt_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        idx[i + 1] = a
+    return idx
 
 
 class EnergyVisualizer:
     """Creates visualizations for energy consumption data"""
     
-    def __init__(self, output_dir='static/plots'):
+    # Set once the first text render has warmed matplotlib's font caches
+    _warmed = False
+    
+    # Maximum number of rendered images kept in the render cache
+    CACHE_SIZE = 32
+    
+    # Palettes for up to this many categories are built when the first visualizer starts
+    PALETTE_SIZE = 32
+    
+    # Most file renders kept in render_cache_dir; older ones are pruned by mtime
+    DISK_CACHE_SIZE = 256
+    
+    # Serializes matplotlib drawing across threads and visualizers
+    _render_lock = threading.Lock()
+    
+    # Process pool shared by render_dashboard, created on first use
+    _executor = None
+    _executor_lock = threading.Lock()
+    
+    def __init__(self, output_dir='static/plots', cache_dir=None):
         """
         Initialize visualizer
         
         Args:
             output_dir: Directory to save plots
+            cache_dir: Directory for cached file renders (defaults to a folder in
+                the user's cache dir, outside any served static tree)
         """
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
         
+        if not EnergyVisualizer._warmed:
+            with matplotlib.style.context(ENERGY_STYLE):
+                fig = Figure()
+                FigureCanvasAgg(fig)
+                fig.text(0, 0, 'warm')
+                fig.canvas.draw()
+            EnergyVisualizer._warmed = True
+        
         # Color palette
         self.colors = {
             'primary': '#2E86AB',
@@ -48,8 +313,67 @@ class EnergyVisualizer:
             'warning': '#F77F00',
             'danger': '#D62828'
         }
+        self._rgb = {k: mcolors.to_rgba(v) for k, v in self.colors.items()}
+        # Shared bold fonts, so text artists copy one FontProperties instead of
+        # building one from fontsize/fontweight keywords per call
+        family = ENERGY_STYLE['font.family']
+        self._value_fp = FontProperties(family=family, size=14, weight='bold')        # bar value labels
+        self._panel_title_fp = FontProperties(family=family, size=14, weight='bold')  # compact plot titles
+        self._title_fp = FontProperties(family=family, size=28, weight='bold')
+        self._axis_label_fp = FontProperties(family=family, size=22, weight='bold')
+        
+        # Warm the shared category palette caches
+        for n in range(1, self.PALETTE_SIZE + 1):
+            _hue_palette(n)
+            _rdylgn_gradient(n, 0.3, 0.8)
+            _rdylgn_gradient(n, 0.2, 0.8)
+        
+        # Bar colors by hour of day, indexed by hour
+        self._hour_lut = np.empty((24, 4))
+        self._hour_lut[:6] = mcolors.to_rgba('#4169E1')     # Night - Royal Blue
+        self._hour_lut[6:12] = mcolors.to_rgba('#FFD700')   # Morning - Gold
+        self._hour_lut[12:18] = mcolors.to_rgba('#FF8C00')  # Afternoon - Dark Orange
+        self._hour_lut[18:22] = mcolors.to_rgba('#FF4500')  # Evening - Red Orange
+        self._hour_lut[22:] = mcolors.to_rgba('#4169E1')    # Night - Royal Blue
+        
+        # Bar colors by day of week (Monday = 0), weekdays vs weekend
+        self._weekday_lut = np.empty((7, 4))
+        self._weekday_lut[:5] = self._rgb['primary']
+        self._weekday_lut[5:] = self._rgb['accent']
+        
+        # Weekday / weekend bar colors for the weekly comparison
+        self._weekday_rgb = mcolors.to_rgba('#3498db')
+        self._weekend_rgb = mcolors.to_rgba('#e74c3c')
+        self._other_day_rgb = mcolors.to_rgba('#95a5a6')  # names that are not a weekday
+        
+        # zlib level for PNG output (1 = fastest)
+        self._png_compress = 1
+        
+        # LRU cache of renders, keyed by method, output mode and input fingerprint;
+        # file renders are kept as copies under render_cache_dir, which also
+        # serves later processes plotting the same inputs
+        self._cache = OrderedDict()
+        self.render_cache_dir = self._private_cache_dir(cache_dir)
+        self._cache_lock = threading.Lock()
+        # Output path -> (render key, (mtime_ns, size)) of the last file written
+        # there; a file left untouched since is returned without a copy
+        self._written = {}
+        
+        # Single render thread behind submit_plot / async_plot_*
+        self._render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='viz')
+        
+        # Saved figures are cleared and kept for reuse, keyed by (plot name, nrows, ncols)
+        self._fig_pool = {}
+        self._fig_axes = weakref.WeakKeyDictionary()
+        
+        # Prepared time-series slices per input frame:
+        # {id(frame): {(date_col, days): (column fingerprints, sorted frame, {cols: view})}}.
+        # DataFrames are unhashable, so entries are keyed by id and dropped by a
+        # weakref finalizer when the caller releases the frame; the fingerprints
+        # catch frames edited in place
+        self._slice_cache = {}
     
-    def _save_figure(self, fig, filename, return_base64=False):
+    def _save_figure(self, fig, filename, return_base64=False, dpi=None):
         """
         Save figure to file or return as base64 string
         
@@ -57,24 +381,528 @@ class EnergyVisualizer:
             fig: Matplotlib figure object
             filename: Output filename
             return_base64: If True, return base64 encoded string instead of saving
+            dpi: Output resolution; defaults to 72 for base64 and 100 for files
+                (pass e.g. 150 for print/export)
         
         Returns:
             Filepath or base64 string
         """
+        dpi = dpi or (72 if return_base64 else 100)
+        # Rough PNG size for these flat-colour charts; saves BytesIO/file
+        # buffers from growing in small steps while the encoder writes
+        estimated = int(fig.get_figwidth() * fig.get_figheight() * dpi * dpi * 0.1)
         if return_base64:
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-            buf.seek(0)
-            img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-            plt.close(fig)
+            buf = io.BytesIO(bytearray(estimated))
+            self._write_png(fig, buf, dpi)
+            buf.truncate(buf.tell())
+            with buf.getbuffer() as view:
+                img_base64 = base64.b64encode(view).decode('ascii')
+            self._release_fig(fig)
             return f"data:image/png;base64,{img_base64}"
         else:
             filepath = os.path.join(self.output_dir, filename)
-            fig.savefig(filepath, dpi=100, bbox_inches='tight')
-            plt.close(fig)
+            fmt = os.path.splitext(filename)[1][1:].lower() or 'png'
+            with open(filepath, 'wb', buffering=estimated) as f:
+                if fmt == 'png':
+                    self._write_png(fig, f, dpi)
+                else:
+                    fig.savefig(f, format=fmt, dpi=dpi)
+            self._release_fig(fig)
+            return filepath
+    
+    def _write_png(self, fig, stream, dpi):
+        """
+        Draw a figure and write it to stream as PNG with fast deflate
+        
+        Encoding the Agg buffer through PIL at self._png_compress skips
+        savefig's level-6 zlib pass; these charts are regenerated on demand,
+        so encode time matters more than file size.
+        
+        Args:
+            fig: Matplotlib figure object
+            stream: Binary file-like object to write to
+            dpi: Output resolution
+        """
+        figure_dpi = fig.dpi
+        fig.set_dpi(dpi)
+        fig.canvas.draw()
+        w, h = fig.canvas.get_width_height()
+        rgba = np.frombuffer(fig.canvas.buffer_rgba(), dtype=np.uint8).reshape(h, w, 4)
+        Image.fromarray(rgba).save(stream, 'PNG', dpi=(dpi, dpi),
+                                  compress_level=self._png_compress, optimize=False)
+        fig.set_dpi(figure_dpi)
+    
+    def _cached_render(self, key, builder, save_as, return_base64):
+        """
+        Return a previous render for key, or build and remember a new one
+        
+        Args:
+            key: Hashable render key
+            builder: Callable producing the filepath or base64 string
+            save_as: Output filename for file renders
+            return_base64: Whether builder returns a base64 string
+        
+        Returns:
+            Filepath or base64 string
+        """
+        filepath = None if return_base64 else os.path.join(self.output_dir, save_as)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+            written = None if filepath is None else self._written.get(filepath)
+        
+        # The output file still holds this render: nothing to draw or copy
+        if written is not None and written[0] == key and self._file_stamp(filepath) == written[1]:
             return filepath
+        
+        if cached is not None:
+            if return_base64:
+                return cached
+            if self._copy_entry(cached, filepath):
+                self._mark_written(filepath, key)
+                return filepath
+        
+        if return_base64:
+            entry = result = builder()
+        else:
+            entry = self._cache_entry_path(key, save_as)
+            if self._copy_entry(entry, filepath):
+                # Rendered by an earlier process with the same inputs
+                result = filepath
+            else:
+                result = builder()
+                self._store_entry(result, entry)
+            self._mark_written(result, key)
+        
+        # Eviction only forgets the in-memory entry; files in render_cache_dir are
+        # shared with other processes and are trimmed by _prune_render_cache
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+    
+    @staticmethod
+    def _file_stamp(path):
+        """(mtime_ns, size) of a file, or None if it is missing"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+    
+    def _mark_written(self, filepath, key):
+        """
+        Remember which render an output file holds
+        
+        Args:
+            filepath: Output file that was just written
+            key: Render key of its contents
+        """
+        stamp = self._file_stamp(filepath)
+        with self._cache_lock:
+            self._written[filepath] = (key, stamp)
+    
+    @staticmethod
+    def _private_cache_dir(cache_dir=None):
+        """
+        Directory for cached file renders, readable and writable only by this user
+        
+        Renders are served back to any process sharing the directory, so it must
+        not be one that other users can plant files in. A directory that is not
+        owned by the current user or is group/world writable is replaced by a
+        fresh private temp dir, which keeps the cache working for this process.
+        
+        Args:
+            cache_dir: Requested directory (defaults to
+                $XDG_CACHE_HOME/energy_tracker/renders, or ~/.cache/...)
+        
+        Returns:
+            Path of the cache directory
+        """
+        if cache_dir is None:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+            cache_dir = os.path.join(base, 'energy_tracker', 'renders')
+        try:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            st = os.stat(cache_dir)
+        except OSError:
+            return tempfile.mkdtemp(prefix='energy_tracker_renders_')
+        if hasattr(os, 'getuid') and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+            return tempfile.mkdtemp(prefix='energy_tracker_renders_')
+        return cache_dir
+    
+    def _copy_entry(self, entry, filepath):
+        """
+        Copy a cached render to its output path
+        
+        Args:
+            entry: File under render_cache_dir
+            filepath: Output path
+        
+        Returns:
+            False if the entry is missing (never written, or pruned by another
+            process in the meantime), True once it has been copied
+        """
+        try:
+            shutil.copyfile(entry, filepath)
+        except FileNotFoundError:
+            return False
+        self._touch(entry)
+        return True
+    
+    def _store_entry(self, filepath, entry):
+        """
+        Add a fresh render to render_cache_dir
+        
+        The file is copied under a temporary name and renamed into place, so
+        other processes never see a partly written entry. The cache is only an
+        optimization, so a failed write is ignored.
+        
+        Args:
+            filepath: Rendered output file
+            entry: Cache path to store it under
+        """
+        try:
+            os.makedirs(self.render_cache_dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.render_cache_dir, suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'wb') as dst, open(filepath, 'rb') as src:
+                shutil.copyfileobj(src, dst)
+            os.replace(tmp, entry)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        self._prune_render_cache()
+    
+    @staticmethod
+    def _touch(path):
+        """Mark a cache entry as recently used for _prune_render_cache"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    
+    def _prune_render_cache(self):
+        """Delete the least recently used files beyond DISK_CACHE_SIZE in render_cache_dir"""
+        try:
+            names = os.listdir(self.render_cache_dir)
+        except OSError:
+            return
+        if len(names) <= self.DISK_CACHE_SIZE:
+            return
+        entries = []
+        for name in names:
+            if name.endswith('.tmp'):
+                continue  # another process is still writing it
+            path = os.path.join(self.render_cache_dir, name)
+            try:
+                entries.append((os.stat(path).st_mtime_ns, path))
+            except OSError:
+                pass
+        entries.sort()
+        for _, path in entries[:len(entries) - self.DISK_CACHE_SIZE]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def _cache_entry_path(self, key, save_as):
+        """
+        Path of the on-disk copy of a file render
+        
+        The name digests the method name with the input fingerprint, so the
+        entry is found again after a restart as long as the inputs match. It
+        is salted with _RENDER_SALT, so a deploy that changes this module or
+        matplotlib never serves images drawn by the old code.
+        
+        Args:
+            key: Render key from _memoized_render
+            save_as: Output filename (supplies the extension)
+        
+        Returns:
+            Path under render_cache_dir
+        """
+        name = hashlib.blake2b(_RENDER_SALT + key[0].encode() + key[2] + key[3].encode(), digest_size=16).hexdigest()
+        return os.path.join(self.render_cache_dir, name + os.path.splitext(save_as)[1])
+    
+    def submit_plot(self, method_name, *args, **kwargs):
+        """
+        Queue a plot on the render thread
+        
+        Args:
+            method_name: Name of the plot method, e.g. 'plot_daily_consumption'
+            *args, **kwargs: Arguments for the plot method
+        
+        Returns:
+            Future resolving to the method's filepath or base64 string
+        """
+        method = getattr(self, method_name)
+        key = method.render_key(self, *args, **kwargs)[0]
+        with self._cache_lock:
+            cached = key in self._cache
+        if not cached:
+            return self._render_executor.submit(method, *args, **kwargs)
+        
+        # Cache hits are cheap, so answer them without waiting behind queued renders
+        future = Future()
+        try:
+            future.set_result(method(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    @classmethod
+    def _get_executor(cls):
+        """Return the shared render process pool, creating it on first use"""
+        with cls._executor_lock:
+            if cls._executor is None:
+                # Never fork this process directly: the render thread may hold
+                # _render_lock (or a matplotlib lock) at that moment, and the
+                # child would inherit it locked. The forkserver is a clean
+                # single-threaded process that imports this module once, so
+                # workers still start with matplotlib and the font cache loaded
+                if 'forkserver' in multiprocessing.get_all_start_methods():
+                    context = multiprocessing.get_context('forkserver')
+                    if __name__ != '__main__':
+                        context.set_forkserver_preload([__name__])
+                else:
+                    context = multiprocessing.get_context('spawn')
+                cls._executor = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) // 2),
+                                                    mp_context=context, initializer=_init_worker)
+            return cls._executor
+    
+    def render_dashboard(self, tasks):
+        """
+        Render several plots in parallel worker processes
+        
+        Args:
+            tasks: Dictionary mapping a result name to (method_name, args, kwargs),
+                e.g. {'daily': ('plot_daily_consumption', (df,), {'days': 30})}
+        
+        Returns:
+            Dictionary mapping each result name to a base64 image string
+        """
+        for name, (method_name, args, kwargs) in tasks.items():
+            if 'return_base64' in kwargs:
+                raise ValueError(f"render_dashboard task '{name}': results are always base64, "
+                                 "drop return_base64 from its kwargs")
+        
+        executor = self._get_executor()
+        futures = {name: executor.submit(_render_task, self.output_dir, method_name, args, kwargs)
+                   for name, (method_name, args, kwargs) in tasks.items()}
+        return {name: future.result() for name, future in futures.items()}
+    
+    def _acquire_fig(self, name, figsize, nrows=1, ncols=1):
+        """
+        Get a cleared figure of the given shape, reusing one from the pool if possible
+        
+        Args:
+            name: Pool name of the calling plot, e.g. 'weekly_comparison'
+            figsize: Figure size in inches
+            nrows: Number of subplot rows
+            ncols: Number of subplot columns
+        
+        Returns:
+            Tuple of (figure, axes) as returned by Figure.subplots
+        """
+        # ax.clear() keeps tick and grid styling, so only hand a figure back
+        # to the plot method that styled it. The size is not part of the key:
+        # plots that scale with their data resize a pooled figure instead of
+        # leaving one behind per size
+        key = (name, nrows, ncols)
+        with self._cache_lock:
+            pool = self._fig_pool.setdefault(key, [])
+            fig = pool.pop() if pool else None
+        if fig is not None and tuple(fig.get_size_inches()) != tuple(figsize):
+            fig.set_size_inches(figsize)
+        if fig is None:
+            # Plain Agg-backed figures; pyplot's figure manager is never involved
+            fig = Figure(figsize=figsize, layout='constrained')
+            FigureCanvasAgg(fig)
+            axes = fig.subplots(nrows, ncols)
+            self._fig_axes[fig] = (key, axes)
+            return fig, axes
+        return fig, self._fig_axes[fig][1]
+    
+    def _release_fig(self, fig):
+        """
+        Clear a saved figure and return it to the pool (unpooled figures are just dropped)
+        
+        Args:
+            fig: Matplotlib figure object
+        """
+        if fig not in self._fig_axes:
+            return
+        key, axes = self._fig_axes[fig]
+        base_axes = list(np.atleast_1d(axes).ravel())
+        # Drop twin axes and figure legends added on top of the original layout
+        for ax in fig.axes:
+            if ax not in base_axes:
+                ax.remove()
+        for legend in list(fig.legends):
+            legend.remove()
+        for ax in base_axes:
+            ax.clear()
+            # Undo any layout/aspect adjustment so the next draw starts from the grid slot
+            ax.set_subplotspec(ax.get_subplotspec())
+        with self._cache_lock:
+            self._fig_pool[key].append(fig)
+    
+    def _downsample(self, x, y, target):
+        """
+        Reduce a series to at most target points, keeping its visual shape
+        
+        Args:
+            x: numpy array of x values (numeric or datetime64), sorted
+            y: numpy array of y values
+            target: Maximum number of points to keep
+        
+        Returns:
+            Tuple of (x, y) arrays
+        """
+        if y.size <= target or target < 3:
+            return x, y
+        xf = x.astype('datetime64[ns]').astype(np.float64) if x.dtype.kind == 'M' else x.astype(np.float64)
+        idx = _lttb_indices(xf, y.astype(np.float64), target)
+        return x[idx], y[idx]
+    
+    def _format_date_axis(self, ax):
+        """
+        Use compact, unrotated date ticks on the x axis
+        
+        Args:
+            ax: Matplotlib axes with dates on the x axis
+        """
+        # Locators keep a reference to their axis, so each axis gets its own
+        locator = mdates.AutoDateLocator(minticks=5, maxticks=10)
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    
+    def _decimate(self, x, y, max_points):
+        """
+        Average a bar series into at most max_points equal-width buckets
+        
+        Args:
+            x: numpy array of x values, sorted
+            y: numpy array of float64 bar heights
+            max_points: Maximum number of bars to keep
+        
+        Returns:
+            Tuple of (x, y, step): bucket start x values, bucket means and rows per bucket
+        """
+        n = y.size
+        if n <= max_points:
+            return x, y, 1
+        step = -(-n // max_points)
+        starts = np.arange(0, n, step)
+        counts = np.diff(np.append(starts, n))
+        return x[starts], np.add.reduceat(y, starts) / counts, step
+    
+    @staticmethod
+    def _series_stats(values):
+        """
+        Total, max, min and mean of a series, skipping NaN like pandas does
+        
+        Args:
+            values: numpy array of float64 values
+        
+        Returns:
+            Tuple of (total, max, min, mean); total is 0.0 and the rest NaN when
+            there are no valid values
+        """
+        valid = values[~np.isnan(values)]
+        if valid.size == 0:
+            return 0.0, np.nan, np.nan, np.nan
+        total = valid.sum()
+        return total, valid.max(), valid.min(), total / valid.size
+    
+    def _get_tail(self, data, date_col, cols, days=None):
+        """
+        Cached _prep_timeseries: plots sharing one input frame and window sort it only once
+        
+        The sorted window is kept with all columns, so plots reading different
+        columns of the same frame share it. Each column's fingerprint is taken
+        when the window is cut and rechecked for the columns a call reads, so a
+        frame edited in place is re-sliced. The returned slice is shared
+        between plot methods and is not modified.
+        
+        Args:
+            data: Source DataFrame
+            date_col: Name of the date column
+            cols: Columns to return (including date_col)
+            days: Number of most recent rows to keep, or None for all
+        
+        Returns:
+            DataFrame with cols, sorted by date_col
+        """
+        frame_id = id(data)
+        key = (date_col, days)
+        fingerprints = {c: _df_fingerprint(data, [c]) for c in cols}
+        with self._cache_lock:
+            slices = self._slice_cache.get(frame_id)
+            if slices is None:
+                slices = self._slice_cache[frame_id] = {}
+                weakref.finalize(data, self._slice_cache.pop, frame_id, None)
+            cached = slices.get(key)
+        if cached is None or any(cached[0].get(c) != fp for c, fp in fingerprints.items()):
+            for c in data.columns:
+                if c not in fingerprints:
+                    fingerprints[c] = _df_fingerprint(data, [c])
+            cached = (fingerprints, self._prep_timeseries(data, date_col, list(data.columns), days), {})
+            with self._cache_lock:
+                slices[key] = cached
+        views = cached[2]
+        view_key = tuple(cols)
+        with self._cache_lock:
+            tail = views.get(view_key)
+            if tail is None:
+                tail = views[view_key] = cached[1][cols]
+        return tail
+    
+    def _prep_timeseries(self, data, date_col, cols, days=None):
+        """
+        Select the most recent rows of a time series in date order, without copying the input
+        
+        Args:
+            data: Source DataFrame
+            date_col: Name of the date column
+            cols: Columns to return (including date_col)
+            days: Number of most recent rows to keep, or None for all
+        
+        Returns:
+            New DataFrame with cols, sorted by date_col
+        """
+        # Only parse dates that are not already datetime64
+        if data[date_col].dtype.kind != 'M':
+            data = data.assign(**{date_col: pd.to_datetime(data[date_col])})
+        if days is not None:
+            data = data.nlargest(days, date_col)
+        return data.sort_values(date_col)[cols]
     
-    def plot_daily_consumption(self, daily_data, days=30, save_as='daily_consumption.png', return_base64=False):
+    def _to_soa(self, df, cols):
+        """
+        Extract the given columns as a dict of contiguous numpy arrays
+        
+        Args:
+            df: Source DataFrame
+            cols: Column names to extract
+        
+        Returns:
+            Dictionary mapping column name to numpy array
+        """
+        return {c: np.ascontiguousarray(df[c].to_numpy()) for c in cols}
+    
+    @_memoized_render
+    @_energy_style
+    def plot_daily_consumption(self, daily_data, days=30, save_as='daily_consumption.png', return_base64=False, dpi=None):
         """
         Plot daily energy consumption trend
         
@@ -83,45 +911,52 @@ class EnergyVisualizer:
             days: Number of recent days to plot
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         
         Returns:
             Filepath or base64 string
         """
-        df = daily_data.copy()
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.sort_values('date').tail(days)
+        s = self._to_soa(daily_data, ['date', 'total_kwh', 'total_cost'])
+        dates = pd.to_datetime(s['date']).to_numpy()
+        order = np.argsort(dates, kind='stable')
+        # [-0:] would keep every row, so an empty window is cut explicitly
+        order = order[-days:] if days > 0 else order[:0]
+        dates = dates[order]
+        kwh = s['total_kwh'][order].astype(np.float64)
+        cost = s['total_cost'][order].astype(np.float64)
         
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
+        fig, (ax1, ax2) = self._acquire_fig('daily_consumption', (12, 8), 2, 1)
         
         # Energy consumption plot
-        ax1.plot(df['date'], df['total_kwh'], 
+        ax1.plot(dates, kwh, 
                 marker='o', linewidth=2, markersize=4,
                 color=self.colors['primary'], label='Daily Consumption')
-        ax1.fill_between(df['date'], df['total_kwh'], alpha=0.3, color=self.colors['primary'])
-        ax1.set_title('Daily Energy Consumption (kWh)', fontsize=14, fontweight='bold')
+        fill = ax1.fill_between(dates, kwh, alpha=0.3, color=self.colors['primary'])
+        fill.set_rasterized(True)
+        ax1.set_title('Daily Energy Consumption (kWh)', fontproperties=self._panel_title_fp)
         ax1.set_xlabel('Date', fontsize=11)
         ax1.set_ylabel('Energy (kWh)', fontsize=11)
         ax1.grid(True, alpha=0.3)
         ax1.legend()
         
-        # Rotate x-axis labels
-        plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        self._format_date_axis(ax1)
         
         # Cost plot
-        ax2.bar(df['date'], df['total_cost'], 
+        ax2.bar(dates, cost, 
                color=self.colors['accent'], alpha=0.7, label='Daily Cost')
-        ax2.set_title('Daily Energy Cost (₹)', fontsize=14, fontweight='bold')
+        ax2.set_title('Daily Energy Cost (₹)', fontproperties=self._panel_title_fp)
         ax2.set_xlabel('Date', fontsize=11)
         ax2.set_ylabel('Cost (₹)', fontsize=11)
         ax2.grid(True, alpha=0.3, axis='y')
         ax2.legend()
         
-        plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        self._format_date_axis(ax2)
         
-        plt.tight_layout()
-        return self._save_figure(fig, save_as, return_base64)
+        return self._save_figure(fig, save_as, return_base64, dpi)
     
-    def plot_appliance_breakdown(self, appliance_data, top_n=10, save_as='appliance_breakdown.png', return_base64=False):
+    @_memoized_render
+    @_energy_style
+    def plot_appliance_breakdown(self, appliance_data, top_n=10, save_as='appliance_breakdown.png', return_base64=False, dpi=None):
         """
         Plot appliance-wise energy consumption
         
@@ -130,43 +965,52 @@ class EnergyVisualizer:
             top_n: Number of top appliances to show
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         """
-        df = appliance_data.copy()
-        df = df.sort_values('total_kwh', ascending=False).head(top_n)
+        df = appliance_data.iloc[_top_k_desc(appliance_data['total_kwh'].to_numpy(np.float64), top_n)]
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        fig, (ax1, ax2) = self._acquire_fig('appliance_breakdown', (14, 6), 1, 2)
         
         # Bar chart
         bars = ax1.barh(df['appliance_name'], df['total_kwh'], 
                        color=self.colors['secondary'], alpha=0.7)
-        ax1.set_title('Energy Consumption by Appliance (kWh)', fontsize=14, fontweight='bold')
+        ax1.set_title('Energy Consumption by Appliance (kWh)', fontproperties=self._panel_title_fp)
         ax1.set_xlabel('Energy (kWh)', fontsize=11)
         ax1.set_ylabel('Appliance', fontsize=11)
         ax1.grid(True, alpha=0.3, axis='x')
         
         # Add value labels
-        for bar in bars:
-            width = bar.get_width()
-            ax1.text(width, bar.get_y() + bar.get_height()/2, 
-                    f'{width:.2f}', ha='left', va='center', fontsize=9)
-        
-        # Pie chart
-        colors_pie = sns.color_palette("husl", len(df))
-        wedges, texts, autotexts = ax2.pie(df['total_kwh'], labels=df['appliance_name'], 
-                                           autopct='%1.1f%%', startangle=90,
-                                           colors=colors_pie)
-        ax2.set_title('Energy Distribution by Appliance', fontsize=14, fontweight='bold')
-        
-        # Improve pie chart text
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontsize(9)
-            autotext.set_weight('bold')
-        
-        plt.tight_layout()
-        return self._save_figure(fig, save_as, return_base64)
+        ax1.bar_label(bars, fmt='%.2f', padding=2, fontsize=9)
+        
+        # Pie chart - wedge geometry computed up front instead of via ax.pie
+        colors_pie = _hue_palette(len(df))
+        vals = df['total_kwh'].to_numpy(np.float64)
+        frac = vals / vals.sum()
+        angles = np.concatenate(([90.0], 90.0 - np.cumsum(frac) * 360.0))
+        wedges = [Wedge((0, 0), 1, angles[i + 1], angles[i], facecolor=colors_pie[i])
+                  for i in range(len(vals))]
+        ax2.add_collection(PatchCollection(wedges, match_original=True))
+        
+        mid = np.deg2rad((angles[:-1] + angles[1:]) / 2)
+        cos_mid, sin_mid = np.cos(mid).tolist(), np.sin(mid).tolist()
+        for name, dx, dy, share in zip(df['appliance_name'].tolist(), cos_mid, sin_mid, frac.tolist()):
+            ax2.text(1.1 * dx, 1.1 * dy, name, ha='left' if dx >= 0 else 'right', va='center')
+            # Skip percentage text on slivers too thin to hold it
+            if share >= 0.03:
+                ax2.text(0.6 * dx, 0.6 * dy, f'{share * 100:.1f}%',
+                         ha='center', va='center', color='white', fontsize=9, fontweight='bold')
+        
+        ax2.set_xlim(-1.25, 1.25)
+        ax2.set_ylim(-1.25, 1.25)
+        ax2.set_aspect('equal')
+        ax2.axis('off')
+        ax2.set_title('Energy Distribution by Appliance', fontproperties=self._panel_title_fp)
+        
+        return self._save_figure(fig, save_as, return_base64, dpi)
     
-    def plot_energy_consumption_only(self, daily_data, days=30, save_as='energy_consumption.png', return_base64=False):
+    @_memoized_render
+    @_energy_style
+    def plot_energy_consumption_only(self, daily_data, days=30, save_as='energy_consumption.png', return_base64=False, dpi=None):
         """
         Plot only daily energy consumption (kWh)
         
@@ -175,44 +1019,48 @@ class EnergyVisualizer:
             days: Number of recent days to plot
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         """
-        df = daily_data.copy()
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.sort_values('date').tail(days)
+        df = self._get_tail(daily_data, 'date', ['date', 'total_kwh'], days)
         
-        fig, ax = plt.subplots(figsize=(16, 10))
+        fig, ax = self._acquire_fig('energy_consumption_only', (16, 10))
+        
+        # No point drawing more vertices than the figure has pixel columns
+        target = int(fig.get_figwidth() * fig.dpi * 2)
+        kwh = df['total_kwh'].to_numpy(np.float64)
+        x, y = self._downsample(df['date'].to_numpy(), kwh, target)
         
         # Energy consumption plot with gradient fill
-        ax.plot(df['date'], df['total_kwh'], 
+        ax.plot(x, y, 
                 marker='o', linewidth=4.5, markersize=12,
                 color=self.colors['primary'], label='Daily Consumption',
                 markerfacecolor='white', markeredgewidth=3.5, markeredgecolor=self.colors['primary'])
-        ax.fill_between(df['date'], df['total_kwh'], alpha=0.25, color=self.colors['primary'])
+        ax.fill_between(x, y, alpha=0.25, color=self.colors['primary'], rasterized=True)
         
         # Add average line
-        avg_kwh = df['total_kwh'].mean()
+        total, mx, mn, avg_kwh = self._series_stats(kwh)
         ax.axhline(y=avg_kwh, color=self.colors['warning'], linestyle='--', 
                    linewidth=3.5, label=f'Average: {avg_kwh:.2f} kWh', alpha=0.8)
         
-        ax.set_title('⚡ Daily Energy Consumption Trend', fontsize=28, fontweight='bold', pad=30)
-        ax.set_xlabel('Date', fontsize=22, fontweight='bold')
-        ax.set_ylabel('Energy Consumption (kWh)', fontsize=22, fontweight='bold')
+        ax.set_title('⚡ Daily Energy Consumption Trend', fontproperties=self._title_fp, pad=30)
+        ax.set_xlabel('Date', fontproperties=self._axis_label_fp)
+        ax.set_ylabel('Energy Consumption (kWh)', fontproperties=self._axis_label_fp)
         ax.grid(True, alpha=0.3, linestyle='--', linewidth=1.5)
         ax.legend(fontsize=18, loc='upper left', framealpha=0.95, shadow=True)
         
         # Add statistics box with larger font
-        stats_text = f"Total: {df['total_kwh'].sum():.2f} kWh\nMax: {df['total_kwh'].max():.2f} kWh\nMin: {df['total_kwh'].min():.2f} kWh"
+        stats_text = f"Total: {total:.2f} kWh\nMax: {mx:.2f} kWh\nMin: {mn:.2f} kWh"
         ax.text(0.98, 0.97, stats_text, transform=ax.transAxes, 
                 fontsize=17, verticalalignment='top', horizontalalignment='right',
                 bbox=dict(boxstyle='round', facecolor='white', alpha=0.9, edgecolor=self.colors['primary'], linewidth=3))
         
-        # Rotate x-axis labels
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right', fontsize=16)
+        self._format_date_axis(ax)
         
-        plt.tight_layout()
-        return self._save_figure(fig, save_as, return_base64)
+        return self._save_figure(fig, save_as, return_base64, dpi)
     
-    def plot_cost_analysis_only(self, daily_data, days=30, save_as='cost_analysis.png', return_base64=False):
+    @_memoized_render
+    @_energy_style
+    def plot_cost_analysis_only(self, daily_data, days=30, save_as='cost_analysis.png', return_base64=False, dpi=None):
         """
         Plot only daily cost analysis (₹)
         
@@ -221,52 +1069,57 @@ class EnergyVisualizer:
             days: Number of recent days to plot
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         """
-        df = daily_data.copy()
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.sort_values('date').tail(days)
+        df = self._get_tail(daily_data, 'date', ['date', 'total_cost'], days)
+        
+        fig, ax = self._acquire_fig('cost_analysis_only', (16, 10))
         
-        fig, ax = plt.subplots(figsize=(16, 10))
+        # Bars narrower than a pixel column are invisible, so average them into buckets
+        daily_costs = df['total_cost'].to_numpy(np.float64)
+        total, mx, mn, avg_cost = self._series_stats(daily_costs)
+        dates, costs, step = self._decimate(df['date'].to_numpy(), daily_costs,
+                                            int(fig.get_figwidth() * fig.dpi))
         
         # Cost plot with gradient colors
-        colors_gradient = [self.colors['accent'] if x > df['total_cost'].mean() 
-                          else self.colors['success'] for x in df['total_cost']]
-        bars = ax.bar(df['date'], df['total_cost'], 
+        above_avg = costs > avg_cost
+        colors_gradient = np.where(above_avg[:, None], self._rgb['accent'], self._rgb['success'])
+        ax.bar(dates, costs, width=0.8 * step, align='edge' if step > 1 else 'center',
                      color=colors_gradient, alpha=0.85,
-                     edgecolor='white', linewidth=2)
+                     edgecolor='white', linewidth=2, rasterized=True)
         
         # Add average line
-        avg_cost = df['total_cost'].mean()
         ax.axhline(y=avg_cost, color=self.colors['danger'], linestyle='--', 
                    linewidth=3.5, label=f'Average: ₹{avg_cost:.2f}', alpha=0.8)
         
-        ax.set_title('💰 Daily Energy Cost Analysis', fontsize=28, fontweight='bold', pad=30)
-        ax.set_xlabel('Date', fontsize=22, fontweight='bold')
-        ax.set_ylabel('Cost (₹)', fontsize=22, fontweight='bold')
+        ax.set_title('💰 Daily Energy Cost Analysis', fontproperties=self._title_fp, pad=30)
+        ax.set_xlabel('Date', fontproperties=self._axis_label_fp)
+        ax.set_ylabel('Cost (₹)', fontproperties=self._axis_label_fp)
         ax.grid(True, alpha=0.3, axis='y', linestyle='--', linewidth=1.5)
         ax.legend(fontsize=18, loc='upper left', framealpha=0.95, shadow=True)
         
-        # Add value labels on bars (only for higher bars to avoid clutter)
-        for i, bar in enumerate(bars):
-            height = bar.get_height()
-            if height > df['total_cost'].mean():
-                ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                       f'₹{height:.1f}',
-                       ha='center', va='bottom', fontsize=14, fontweight='bold',
-                       bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, edgecolor='none'))
+        # Add value labels on bars (only for higher bars to avoid clutter), placed
+        # from the plotted arrays: bar centres sit 0.4 * step in from an edge
+        label_x = mdates.date2num(dates[above_avg]) + (0.4 * step if step > 1 else 0.0)
+        for x, height in zip(label_x, costs[above_avg]):
+            ax.text(x, height + 0.5,
+                   f'₹{height:.1f}',
+                   ha='center', va='bottom', fontproperties=self._value_fp,
+                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, edgecolor='none'))
         
         # Add statistics box with larger font
-        stats_text = f"Total: ₹{df['total_cost'].sum():.2f}\nMax: ₹{df['total_cost'].max():.2f}\nMin: ₹{df['total_cost'].min():.2f}"
+        stats_text = f"Total: ₹{total:.2f}\nMax: ₹{mx:.2f}\nMin: ₹{mn:.2f}"
         ax.text(0.98, 0.97, stats_text, transform=ax.transAxes, 
                 fontsize=17, verticalalignment='top', horizontalalignment='right',
                 bbox=dict(boxstyle='round', facecolor='white', alpha=0.9, edgecolor=self.colors['accent'], linewidth=3))
         
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right', fontsize=16)
+        self._format_date_axis(ax)
         
-        plt.tight_layout()
-        return self._save_figure(fig, save_as, return_base64)
+        return self._save_figure(fig, save_as, return_base64, dpi)
     
-    def plot_appliance_bar_only(self, appliance_data, top_n=10, save_as='appliance_bar.png', return_base64=False):
+    @_memoized_render
+    @_energy_style
+    def plot_appliance_bar_only(self, appliance_data, top_n=10, save_as='appliance_bar.png', return_base64=False, dpi=None):
         """
         Plot only appliance bar chart
         
@@ -275,33 +1128,35 @@ class EnergyVisualizer:
             top_n: Number of top appliances to show
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         """
-        df = appliance_data.copy()
-        df = df.sort_values('total_kwh', ascending=False).head(top_n)
+        df = appliance_data.iloc[_top_k_desc(appliance_data['total_kwh'].to_numpy(np.float64), top_n)]
         
-        fig, ax = plt.subplots(figsize=(16, 11))
+        fig, ax = self._acquire_fig('appliance_bar_only', (16, 11))
         
         # Create color gradient based on consumption
-        colors_gradient = plt.cm.RdYlGn_r(np.linspace(0.3, 0.8, len(df)))
+        colors_gradient = _rdylgn_gradient(len(df), 0.3, 0.8)
         
         # Bar chart
         bars = ax.barh(df['appliance_name'], df['total_kwh'], 
                        color=colors_gradient, alpha=0.9,
-                       edgecolor='white', linewidth=2.5)
-        ax.set_title('🔌 Energy Consumption by Appliance', fontsize=28, fontweight='bold', pad=30)
-        ax.set_xlabel('Energy Consumption (kWh)', fontsize=22, fontweight='bold')
-        ax.set_ylabel('Appliance', fontsize=22, fontweight='bold')
+                       edgecolor='white', linewidth=2.5, rasterized=True)
+        ax.set_title('🔌 Energy Consumption by Appliance', fontproperties=self._title_fp, pad=30)
+        ax.set_xlabel('Energy Consumption (kWh)', fontproperties=self._axis_label_fp)
+        ax.set_ylabel('Appliance', fontproperties=self._axis_label_fp)
         ax.grid(True, alpha=0.3, axis='x', linestyle='--', linewidth=1.5)
         
-        # Add value labels with cost - larger font
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            cost = df.iloc[i]['total_cost']
-            ax.text(width + 0.5, bar.get_y() + bar.get_height()/2, 
-                    f'{width:.2f} kWh\n(₹{cost:.2f})', ha='left', va='center', 
-                    fontsize=15, fontweight='bold', 
-                    bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=0.9, 
-                             edgecolor=colors_gradient[i], linewidth=2.5))
+        # Add value labels with cost - larger font (leave headroom so they stay on canvas)
+        ax.margins(x=0.2)
+        widths = df['total_kwh'].to_numpy(np.float64)
+        costs = df['total_cost'].to_numpy(np.float64)
+        labels = np.char.add(np.char.mod('%.2f kWh\n(₹', widths), np.char.mod('%.2f)', costs))
+        annotations = ax.bar_label(bars, labels=labels, padding=5,
+                                   fontsize=15, fontweight='bold',
+                                   bbox=dict(boxstyle='round,pad=0.5', facecolor='white',
+                                             alpha=0.9, linewidth=2.5))
+        for annotation, color in zip(annotations, colors_gradient):
+            annotation.get_bbox_patch().set_edgecolor(color)
         
         # Add total consumption text - larger font
         total_kwh = df['total_kwh'].sum()
@@ -309,10 +1164,11 @@ class EnergyVisualizer:
                 fontsize=18, verticalalignment='top', fontweight='bold',
                 bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.3, edgecolor='orange', linewidth=3))
         
-        plt.tight_layout()
-        return self._save_figure(fig, save_as, return_base64)
+        return self._save_figure(fig, save_as, return_base64, dpi)
     
-    def plot_appliance_pie_only(self, appliance_data, top_n=10, save_as='appliance_pie.png', return_base64=False):
+    @_memoized_render
+    @_energy_style
+    def plot_appliance_pie_only(self, appliance_data, top_n=10, save_as='appliance_pie.png', return_base64=False, dpi=None):
         """
         Plot only appliance pie chart
         
@@ -321,9 +1177,9 @@ class EnergyVisualizer:
             top_n: Number of top appliances to show
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         """
-        df = appliance_data.copy()
-        df = df.sort_values('total_kwh', ascending=False).head(top_n)
+        df = appliance_data.iloc[_top_k_desc(appliance_data['total_kwh'].to_numpy(np.float64), top_n)]
         
         # Use a distinct color palette
         colors_palette = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8', 
@@ -332,9 +1188,9 @@ class EnergyVisualizer:
         # Explode top 3 slices
         explode = [0.1, 0.05, 0.03] + [0] * (len(df) - 3) if len(df) >= 3 else [0.05] * len(df)
         
-        fig, ax = plt.subplots(figsize=(14, 12))
+        fig, ax = self._acquire_fig('appliance_pie_only', (14, 12))
         
-        # Create pie chart
+        # Create pie chart - much larger text
         wedges, texts, autotexts = ax.pie(df['total_kwh'], 
                                             labels=df['appliance_name'], 
                                             autopct='%1.1f%%',
@@ -342,24 +1198,17 @@ class EnergyVisualizer:
                                             colors=colors_palette[:len(df)],
                                             explode=explode,
                                             shadow=True,
-                                            wedgeprops=dict(edgecolor='white', linewidth=3))
+                                            wedgeprops=dict(edgecolor='white', linewidth=3),
+                                            textprops=dict(fontsize=18, fontweight='bold'))
+        setp(autotexts, color='white', fontsize=17)
         
-        # Enhance text sizes - much larger
-        for text in texts:
-            text.set_fontsize(18)
-            text.set_fontweight('bold')
-        
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontsize(17)
-            autotext.set_fontweight('bold')
-        
-        ax.set_title('📊 Energy Distribution by Appliance', fontsize=28, fontweight='bold', pad=30)
+        ax.set_title('📊 Energy Distribution by Appliance', fontproperties=self._title_fp, pad=30)
         
         # Add legend with consumption values - larger font
-        legend_labels = [f'{name}: {kwh:.2f} kWh' for name, kwh in zip(df['appliance_name'], df['total_kwh'])]
-        ax.legend(legend_labels, loc='center left', bbox_to_anchor=(1, 0, 0.5, 1), 
-                 fontsize=16, frameon=True, shadow=True, fancybox=True)
+        legend_labels = np.char.add(df['appliance_name'].to_numpy(str),
+                                    np.char.mod(': %.2f kWh', df['total_kwh'].to_numpy(np.float64)))
+        fig.legend(wedges, legend_labels, loc='outside right center', 
+                   fontsize=16, frameon=True, shadow=True, fancybox=True)
         
         # Add total in center - larger font
         total_kwh = df['total_kwh'].sum()
@@ -368,51 +1217,11 @@ class EnergyVisualizer:
                 bbox=dict(boxstyle='circle', facecolor='white', alpha=0.95, 
                          edgecolor='gray', linewidth=3.5))
         
-        plt.tight_layout()
-        return self._save_figure(fig, save_as, return_base64)
-    
-    def plot_hourly_pattern(self, hourly_data, save_as='hourly_pattern.png', return_base64=False):
-        """
-        Plot average energy consumption by hour of day
-        
-        Args:
-            hourly_data: DataFrame with timestamp and power_usage_kwh
-            save_as: Output filename
-            return_base64: Return as base64 string
-        """
-        df = hourly_data.copy()
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df['hour'] = df['timestamp'].dt.hour
-        
-        # Calculate average consumption per hour
-        hourly_avg = df.groupby('hour')['power_usage_kwh'].mean().reset_index()
-        
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        bars = ax.bar(hourly_avg['hour'], hourly_avg['power_usage_kwh'], 
-                     color=self.colors['success'], alpha=0.7)
-        
-        # Highlight peak hours
-        peak_hour = hourly_avg.loc[hourly_avg['power_usage_kwh'].idxmax(), 'hour']
-        bars[int(peak_hour)].set_color(self.colors['danger'])
-        
-        ax.set_title('Average Energy Consumption by Hour of Day', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Hour of Day', fontsize=11)
-        ax.set_ylabel('Average Energy (kWh)', fontsize=11)
-        ax.set_xticks(range(24))
-        ax.grid(True, alpha=0.3, axis='y')
-        
-        # Add peak hour annotation
-        ax.annotate(f'Peak Hour: {int(peak_hour)}:00', 
-                   xy=(peak_hour, hourly_avg.loc[hourly_avg['hour'] == peak_hour, 'power_usage_kwh'].values[0]),
-                   xytext=(peak_hour + 2, hourly_avg['power_usage_kwh'].max() * 0.9),
-                   arrowprops=dict(arrowstyle='->', color='red', lw=2),
-                   fontsize=10, fontweight='bold')
-        
-        plt.tight_layout()
-        return self._save_figure(fig, save_as, return_base64)
+        return self._save_figure(fig, save_as, return_base64, dpi)
     
-    def plot_weekly_pattern(self, daily_data, save_as='weekly_pattern.png', return_base64=False):
+    @_memoized_render
+    @_energy_style
+    def plot_weekly_pattern(self, daily_data, save_as='weekly_pattern.png', return_base64=False, dpi=None):
         """
         Plot average energy consumption by day of week
         
@@ -420,38 +1229,36 @@ class EnergyVisualizer:
             daily_data: DataFrame with date and total_kwh
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         """
-        df = daily_data.copy()
-        df['date'] = pd.to_datetime(df['date'])
-        df['day_of_week'] = df['date'].dt.dayofweek
+        df = self._get_tail(daily_data, 'date', ['date', 'total_kwh'])
         
         # Calculate average consumption per day of week
-        weekly_avg = df.groupby('day_of_week')['total_kwh'].mean().reset_index()
+        dow = df['date'].dt.dayofweek.to_numpy()
+        sums = np.bincount(dow, weights=df['total_kwh'].to_numpy(np.float64), minlength=7)
+        weekly_avg = sums / np.maximum(np.bincount(dow, minlength=7), 1)
         
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._acquire_fig('weekly_pattern', (10, 6))
         
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        colors = [self.colors['primary'] if i < 5 else self.colors['accent'] for i in range(7)]
+        colors = self._weekday_lut
         
-        bars = ax.bar(range(7), weekly_avg['total_kwh'], color=colors, alpha=0.7)
-        ax.set_title('Average Energy Consumption by Day of Week', fontsize=14, fontweight='bold')
+        bars = ax.bar(range(7), weekly_avg, color=colors, alpha=0.7)
+        ax.set_title('Average Energy Consumption by Day of Week', fontproperties=self._panel_title_fp)
         ax.set_xlabel('Day of Week', fontsize=11)
         ax.set_ylabel('Average Energy (kWh)', fontsize=11)
         ax.set_xticks(range(7))
-        ax.set_xticklabels(days, rotation=45, ha='right')
+        ax.set_xticklabels(DAY_NAMES, rotation=45, ha='right')
         ax.grid(True, alpha=0.3, axis='y')
         
         # Add value labels
-        for i, bar in enumerate(bars):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2, height,
-                   f'{height:.1f}', ha='center', va='bottom', fontsize=9)
+        ax.bar_label(bars, fmt='%.1f', padding=2, fontsize=9)
         
-        plt.tight_layout()
-        return self._save_figure(fig, save_as, return_base64)
+        return self._save_figure(fig, save_as, return_base64, dpi)
     
+    @_memoized_render
+    @_energy_style
     def plot_prediction_vs_actual(self, actual_data, predicted_data, days=30, 
-                                  save_as='prediction_comparison.png', return_base64=False):
+                                  save_as='prediction_comparison.png', return_base64=False, dpi=None):
         """
         Plot predicted vs actual consumption
         
@@ -461,44 +1268,52 @@ class EnergyVisualizer:
             days: Number of days to show
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         """
-        actual = actual_data.copy().tail(days)
-        actual['date'] = pd.to_datetime(actual['date'])
+        actual = self._get_tail(actual_data, 'date', ['date', 'total_kwh'], days)
+        predicted = self._get_tail(predicted_data, 'date', ['date', 'predicted_kwh'])
+        actual_x, actual_y = actual['date'].to_numpy(), actual['total_kwh'].to_numpy(np.float64)
+        pred_x, pred_y = predicted['date'].to_numpy(), predicted['predicted_kwh'].to_numpy(np.float64)
         
-        predicted = predicted_data.copy()
-        predicted['date'] = pd.to_datetime(predicted['date'])
+        fig, ax = self._acquire_fig('prediction_vs_actual', (12, 6))
         
-        fig, ax = plt.subplots(figsize=(12, 6))
+        # No point drawing more vertices than the figure has pixel columns
+        target = int(fig.get_figwidth() * fig.dpi * 2)
+        actual_x, actual_y = self._downsample(actual_x, actual_y, target)
+        pred_x, pred_y = self._downsample(pred_x, pred_y, target)
         
         # Plot actual data
-        ax.plot(actual['date'], actual['total_kwh'], 
+        ax.plot(actual_x, actual_y, 
                marker='o', linewidth=2, markersize=5,
                color=self.colors['primary'], label='Actual', alpha=0.8)
         
         # Plot predictions
-        ax.plot(predicted['date'], predicted['predicted_kwh'], 
+        ax.plot(pred_x, pred_y, 
                marker='s', linewidth=2, markersize=5, linestyle='--',
                color=self.colors['danger'], label='Predicted', alpha=0.8)
         
         # Add prediction range (confidence interval)
-        if 'confidence_score' in predicted.columns:
-            lower_bound = predicted['predicted_kwh'] * 0.9
-            upper_bound = predicted['predicted_kwh'] * 1.1
-            ax.fill_between(predicted['date'], lower_bound, upper_bound, 
-                           color=self.colors['danger'], alpha=0.2)
-        
-        ax.set_title('Energy Consumption: Actual vs Predicted', fontsize=14, fontweight='bold')
+        if 'confidence_score' in predicted_data.columns:
+            lower_bound = np.empty_like(pred_y)
+            upper_bound = np.empty_like(pred_y)
+            _conf_bounds(pred_y, lower_bound, upper_bound)
+            band = ax.fill_between(pred_x, lower_bound, upper_bound, 
+                                  color=self.colors['danger'], alpha=0.2)
+            band.set_rasterized(True)
+        
+        ax.set_title('Energy Consumption: Actual vs Predicted', fontproperties=self._panel_title_fp)
         ax.set_xlabel('Date', fontsize=11)
         ax.set_ylabel('Energy (kWh)', fontsize=11)
         ax.grid(True, alpha=0.3)
         ax.legend(fontsize=11)
         
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
-        plt.tight_layout()
+        self._format_date_axis(ax)
         
-        return self._save_figure(fig, save_as, return_base64)
+        return self._save_figure(fig, save_as, return_base64, dpi)
     
-    def plot_monthly_trend(self, monthly_data, months=12, save_as='monthly_trend.png', return_base64=False):
+    @_memoized_render
+    @_energy_style
+    def plot_monthly_trend(self, monthly_data, months=12, save_as='monthly_trend.png', return_base64=False, dpi=None):
         """
         Plot monthly energy consumption trend
         
@@ -507,26 +1322,36 @@ class EnergyVisualizer:
             months: Number of recent months to plot
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         """
-        df = monthly_data.copy()
-        df['date'] = pd.to_datetime(df[['year', 'month']].assign(day=1))
-        df = df.sort_values('date').tail(months)
-        
-        fig, ax = plt.subplots(figsize=(12, 6))
+        # Month starts straight from year/month integers
+        year = monthly_data['year'].to_numpy(np.int64)
+        month = monthly_data['month'].to_numpy(np.int64)
+        dates_np = np.datetime64('1970-01', 'M') + (year - 1970) * 12 + (month - 1)
+        order = np.argsort(dates_np, kind='stable')
+        order = order[-months:] if months > 0 else order[:0]
+        dates_np = dates_np[order]
+        kwh = monthly_data['total_kwh'].to_numpy(np.float64)[order]
+        cost = monthly_data['total_cost'].to_numpy(np.float64)[order]
+        x = np.arange(order.size)
+        
+        fig, ax = self._acquire_fig('monthly_trend', (12, 6))
         
         # Bar chart with line overlay
-        bars = ax.bar(range(len(df)), df['total_kwh'], 
+        bars = ax.bar(x, kwh, 
                      color=self.colors['secondary'], alpha=0.6, label='Monthly Consumption')
         ax2 = ax.twinx()
-        line = ax2.plot(range(len(df)), df['total_cost'], 
+        line = ax2.plot(x, cost, 
                        color=self.colors['warning'], marker='o', linewidth=2,
                        label='Monthly Cost')
         
         # Formatting
-        month_labels = df['date'].dt.strftime('%b %Y')
-        ax.set_xticks(range(len(df)))
+        months_i = dates_np.astype(np.int64) % 12
+        years = dates_np.astype('datetime64[Y]').astype(np.int64) + 1970
+        month_labels = np.char.add(np.char.add(MONTH_ABBR[months_i], ' '), years.astype(str))
+        ax.set_xticks(x)
         ax.set_xticklabels(month_labels, rotation=45, ha='right')
-        ax.set_title('Monthly Energy Consumption and Cost', fontsize=14, fontweight='bold')
+        ax.set_title('Monthly Energy Consumption and Cost', fontproperties=self._panel_title_fp)
         ax.set_xlabel('Month', fontsize=11)
         ax.set_ylabel('Energy (kWh)', fontsize=11, color=self.colors['secondary'])
         ax2.set_ylabel('Cost (₹)', fontsize=11, color=self.colors['warning'])
@@ -537,10 +1362,11 @@ class EnergyVisualizer:
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
         
-        plt.tight_layout()
-        return self._save_figure(fig, save_as, return_base64)
+        return self._save_figure(fig, save_as, return_base64, dpi)
     
-    def create_dashboard_summary(self, stats_dict, save_as='dashboard_summary.png', return_base64=False):
+    @_memoized_render
+    @_energy_style
+    def create_dashboard_summary(self, stats_dict, save_as='dashboard_summary.png', return_base64=False, dpi=None):
         """
         Create a summary visualization with key statistics
         
@@ -548,9 +1374,15 @@ class EnergyVisualizer:
             stats_dict: Dictionary with keys: total_kwh, total_cost, avg_daily, peak_day, etc.
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         """
-        fig = plt.figure(figsize=(12, 6))
-        gs = fig.add_gridspec(2, 3, hspace=0.4, wspace=0.3)
+        # One fixed axes under the title band; a text-only card grid needs no layout solve
+        fig = Figure(figsize=(12, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.add_axes([0, 0, 1, 0.9])
+        ax.set_xlim(0, 3)
+        ax.set_ylim(0, 2)
+        ax.set_axis_off()
         
         # Define stat cards
         stats = [
@@ -562,30 +1394,32 @@ class EnergyVisualizer:
             ('Efficiency Score', f"{stats_dict.get('efficiency_score', 0):.0f}/100", self.colors['secondary'])
         ]
         
-        # Create stat cards
-        positions = [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
-        
-        for (row, col), (title, value, color) in zip(positions, stats):
-            ax = fig.add_subplot(gs[row, col])
-            ax.text(0.5, 0.6, value, ha='center', va='center', 
+        # Create stat cards on one shared axes: 3 columns x 2 rows, first row on top
+        cols = np.tile(np.arange(3), 2)
+        rows = np.repeat([1, 0], 3)
+        card_colors = mcolors.to_rgba_array([color for _, _, color in stats], alpha=0.1)
+        
+        # Add backgrounds
+        # (one x unit is 4in and one y unit 2.7in, so scale the rounding to stay circular)
+        rects = [FancyBboxPatch((c + 0.05, r + 0.1), 0.9, 0.8,
+                                boxstyle='round,pad=0,rounding_size=0.04', mutation_aspect=4 / 2.7)
+                 for c, r in zip(cols, rows)]
+        ax.add_collection(PatchCollection(rects, facecolors=card_colors,
+                                          edgecolors=card_colors, linewidths=2))
+        
+        for c, r, (title, value, color) in zip(cols, rows, stats):
+            ax.text(c + 0.5, r + 0.6, value, ha='center', va='center', 
                    fontsize=20, fontweight='bold', color=color)
-            ax.text(0.5, 0.3, title, ha='center', va='center',
+            ax.text(c + 0.5, r + 0.3, title, ha='center', va='center',
                    fontsize=12, color='gray')
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis('off')
-            
-            # Add background
-            rect = plt.Rectangle((0.05, 0.1), 0.9, 0.8, 
-                                fill=True, facecolor=color, alpha=0.1,
-                                edgecolor=color, linewidth=2)
-            ax.add_patch(rect)
         
         fig.suptitle('Energy Consumption Dashboard', fontsize=16, fontweight='bold', y=0.98)
         
-        return self._save_figure(fig, save_as, return_base64)
+        return self._save_figure(fig, save_as, return_base64, dpi)
     
-    def plot_hourly_pattern(self, hourly_data, save_as='hourly_pattern.png', return_base64=False):
+    @_memoized_render
+    @_energy_style
+    def plot_hourly_pattern(self, hourly_data, save_as='hourly_pattern.png', return_base64=False, dpi=None):
         """
         Plot hourly consumption pattern
         
@@ -593,20 +1427,12 @@ class EnergyVisualizer:
             hourly_data: DataFrame with columns: hour, avg_kwh
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         """
-        fig, ax = plt.subplots(figsize=(16, 10))
-        
-        # Define time periods with colors
-        hour_colors = []
-        for hour in hourly_data['hour']:
-            if 6 <= hour < 12:
-                hour_colors.append('#FFD700')  # Morning - Gold
-            elif 12 <= hour < 18:
-                hour_colors.append('#FF8C00')  # Afternoon - Dark Orange
-            elif 18 <= hour < 22:
-                hour_colors.append('#FF4500')  # Evening - Red Orange
-            else:
-                hour_colors.append('#4169E1')  # Night - Royal Blue
+        fig, ax = self._acquire_fig('hourly_pattern', (16, 10))
+        
+        # Color each hour by its time period
+        hour_colors = self._hour_lut[hourly_data['hour'].to_numpy(np.int64)]
         
         bars = ax.bar(hourly_data['hour'], hourly_data['avg_kwh'], 
                      color=hour_colors, alpha=0.85, edgecolor='white', linewidth=2)
@@ -616,9 +1442,9 @@ class EnergyVisualizer:
         peak_value = hourly_data['avg_kwh'].max()
         ax.plot(peak_hour, peak_value, 'r*', markersize=30, label=f'Peak Hour: {int(peak_hour)}:00')
         
-        ax.set_title('⏰ Average Hourly Energy Consumption Pattern', fontsize=28, fontweight='bold', pad=30)
-        ax.set_xlabel('Hour of Day', fontsize=22, fontweight='bold')
-        ax.set_ylabel('Average Consumption (kWh)', fontsize=22, fontweight='bold')
+        ax.set_title('⏰ Average Hourly Energy Consumption Pattern', fontproperties=self._title_fp, pad=30)
+        ax.set_xlabel('Hour of Day', fontproperties=self._axis_label_fp)
+        ax.set_ylabel('Average Consumption (kWh)', fontproperties=self._axis_label_fp)
         ax.set_xticks(range(0, 24))
         ax.set_xticklabels([f'{h}:00' for h in range(0, 24)], rotation=45, ha='right', fontsize=14)
         ax.grid(True, alpha=0.3, axis='y', linestyle='--', linewidth=1.5)
@@ -634,10 +1460,11 @@ class EnergyVisualizer:
         ax.text(2, ax.get_ylim()[1]*0.95, '🌙 Night', fontsize=16, ha='center',
                bbox=dict(boxstyle='round', facecolor='#4169E1', alpha=0.5))
         
-        plt.tight_layout()
-        return self._save_figure(fig, save_as, return_base64)
+        return self._save_figure(fig, save_as, return_base64, dpi)
     
-    def plot_weekly_comparison(self, weekly_data, save_as='weekly_comparison.png', return_base64=False):
+    @_memoized_render
+    @_energy_style
+    def plot_weekly_comparison(self, weekly_data, save_as='weekly_comparison.png', return_base64=False, dpi=None):
         """
         Plot weekday vs weekend comparison
         
@@ -645,42 +1472,47 @@ class EnergyVisualizer:
             weekly_data: DataFrame with columns: day_name, avg_kwh, total_cost
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 9))
-        
-        # Define day order
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        weekly_data['day_name'] = pd.Categorical(weekly_data['day_name'], categories=day_order, ordered=True)
-        weekly_data = weekly_data.sort_values('day_name')
-        
-        # Color weekdays vs weekends
-        colors = ['#3498db' if day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'] 
-                 else '#e74c3c' for day in weekly_data['day_name']]
-        
-        # Energy consumption by day
-        bars1 = ax1.bar(weekly_data['day_name'], weekly_data['avg_kwh'], 
-                       color=colors, alpha=0.85, edgecolor='white', linewidth=2)
+        fig, (ax1, ax2) = self._acquire_fig('weekly_comparison', (18, 9), 1, 2)
+        
+        # Day codes 0-6 (Mon-Sun, -1 for unknown names); order the rows by code
+        # with unknown names last, without touching the caller's frame
+        day_names = weekly_data['day_name'].to_numpy()
+        codes = pd.Categorical(day_names, categories=DAY_NAMES, ordered=True).codes
+        order = np.argsort(np.where(codes < 0, len(DAY_NAMES), codes), kind='stable')
+        day_names, codes = day_names[order], codes[order]
+        avg_kwh = weekly_data['avg_kwh'].to_numpy(np.float64)[order]
+        
+        # Color weekdays vs weekends; unknown names (-1) belong to neither group
+        is_weekday = (codes >= 0) & (codes < 5)
+        is_weekend = codes >= 5
+        colors = np.select([is_weekday[:, None], is_weekend[:, None]],
+                           [self._weekday_rgb, self._weekend_rgb], self._other_day_rgb)
+        
+        # Energy consumption by day, one bar per slot in day order
+        xs = np.arange(len(day_names))
+        ax1.bar(xs, avg_kwh, color=colors, alpha=0.85, edgecolor='white', linewidth=2)
+        ax1.set_xticks(xs, day_names, rotation=45, fontsize=16)
         ax1.set_title('📅 Average Daily Energy by Day of Week', fontsize=24, fontweight='bold', pad=20)
         ax1.set_xlabel('Day', fontsize=20, fontweight='bold')
         ax1.set_ylabel('Average Consumption (kWh)', fontsize=20, fontweight='bold')
-        ax1.tick_params(axis='x', rotation=45, labelsize=16)
-        ax1.tick_params(axis='y', labelsize=16)
+        ax1.yaxis.set_tick_params(labelsize=16)
         ax1.grid(True, alpha=0.3, axis='y', linestyle='--', linewidth=1.2)
         
         # Add value labels
-        for bar in bars1:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}', ha='center', va='bottom', fontsize=14, fontweight='bold')
+        for x, height in zip(xs, avg_kwh):
+            ax1.add_artist(Text(x, height, f'{height:.1f}', ha='center', va='bottom',
+                                fontproperties=self._value_fp, clip_on=False))
         
-        # Weekday vs Weekend pie chart
-        weekday_avg = weekly_data[weekly_data['day_name'].isin(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'])]['avg_kwh'].mean()
-        weekend_avg = weekly_data[weekly_data['day_name'].isin(['Saturday', 'Sunday'])]['avg_kwh'].mean()
+        # Weekday vs Weekend pie chart, split with the same day masks
+        weekday_avg = avg_kwh[is_weekday].mean() if is_weekday.any() else np.nan
+        weekend_avg = avg_kwh[is_weekend].mean() if is_weekend.any() else np.nan
         
         # Handle NaN values
-        if pd.isna(weekday_avg) or weekday_avg == 0:
+        if np.isnan(weekday_avg) or weekday_avg == 0:
             weekday_avg = 1.0
-        if pd.isna(weekend_avg) or weekend_avg == 0:
+        if np.isnan(weekend_avg) or weekend_avg == 0:
             weekend_avg = 1.0
         
         labels = ['Weekdays\n(Mon-Fri)', 'Weekends\n(Sat-Sun)']
@@ -688,62 +1520,104 @@ class EnergyVisualizer:
         colors_pie = ['#3498db', '#e74c3c']
         explode = (0.1, 0)
         
-        wedges, texts, autotexts = ax2.pie(sizes, explode=explode, labels=labels, colors=colors_pie,
-                                            autopct=lambda pct: f'{pct:.1f}%\n({pct/100*sum(sizes):.1f} kWh)',
-                                            shadow=True, startangle=90,
-                                            textprops={'fontsize': 18, 'fontweight': 'bold'},
-                                            wedgeprops=dict(edgecolor='white', linewidth=3))
+        total = sizes[0] + sizes[1]
+        autotext_strs = [f'{s / total * 100:.1f}%\n({s:.1f} kWh)' for s in sizes]
         
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontsize(16)
+        wedges, texts = ax2.pie(sizes, explode=explode, labels=labels, colors=colors_pie,
+                                autopct=None, shadow=True, startangle=90,
+                                textprops={'fontsize': 18, 'fontweight': 'bold'},
+                                wedgeprops=dict(edgecolor='white', linewidth=3))
+        
+        # Place the precomputed percentage labels where autopct would (pctdistance=0.6)
+        for wedge, label in zip(wedges, autotext_strs):
+            theta = np.deg2rad((wedge.theta1 + wedge.theta2) / 2)
+            cx, cy = wedge.center
+            ax2.add_artist(Text(cx + 0.6 * wedge.r * np.cos(theta), cy + 0.6 * wedge.r * np.sin(theta),
+                                label, ha='center', va='center', color='white',
+                                fontsize=16, fontweight='bold', clip_on=False))
         
         ax2.set_title('⚖️ Weekday vs Weekend Comparison', fontsize=24, fontweight='bold', pad=20)
         
-        plt.tight_layout()
-        return self._save_figure(fig, save_as, return_base64)
+        return self._save_figure(fig, save_as, return_base64, dpi)
     
-    def plot_appliance_efficiency(self, appliance_data, save_as='appliance_efficiency.png', return_base64=False):
+    @_memoized_render
+    @_energy_style
+    def plot_appliance_efficiency(self, appliance_data, top_n=10, save_as='appliance_efficiency.png', return_base64=False, dpi=None):
         """
         Plot appliance efficiency (cost per kWh)
         
         Args:
             appliance_data: DataFrame with columns: appliance_name, total_kwh, total_cost
+            top_n: Number of top appliances to show (None for all)
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         """
-        df = appliance_data.copy()
-        df['efficiency'] = df['total_cost'] / df['total_kwh']  # Cost per kWh
-        df = df.sort_values('efficiency', ascending=False).head(10)
-        
-        fig, ax = plt.subplots(figsize=(16, 10))
+        names = appliance_data['appliance_name'].to_numpy()
+        kwh = appliance_data['total_kwh'].to_numpy(np.float64)
+        cost = appliance_data['total_cost'].to_numpy(np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            eff = cost / kwh  # Cost per kWh
+        
+        # Top n by efficiency, highest first; rounding keeps equal Decimal
+        # ratios tied after float division
+        idx = _top_k_desc(np.round(eff, 12), top_n)
+        names, eff, kwh, cost = names[idx], eff[idx], kwh[idx], cost[idx]
+        k = idx.size
+        
+        # Grow the figure past 12 rows so full reports stay legible, up to a
+        # height Agg can still rasterize
+        fig, ax = self._acquire_fig('appliance_efficiency', (16, min(max(10, 0.8 * k), MAX_EFFICIENCY_HEIGHT)))
         
         # Color code: red for least efficient, green for most efficient
-        colors = plt.cm.RdYlGn_r(np.linspace(0.2, 0.8, len(df)))
-        
-        bars = ax.barh(df['appliance_name'], df['efficiency'], 
-                      color=colors, alpha=0.85, edgecolor='white', linewidth=2)
-        
-        ax.set_title('⚡ Appliance Efficiency Rating (Cost per kWh)', fontsize=28, fontweight='bold', pad=30)
-        ax.set_xlabel('Cost per kWh (₹)', fontsize=22, fontweight='bold')
-        ax.set_ylabel('Appliance', fontsize=22, fontweight='bold')
+        shades = _rdylgn_indices(k, 0.2, 0.8)
+        colors = [_RDYLGN_HEX[i] for i in shades]
+        
+        # Draw the bars as one RGBA raster: each appliance gets BAR_ROWS image rows
+        # (the outer two left empty for the gap between bars) filled up to its
+        # share of the widest bar, so Agg blits a single image instead of
+        # stroking k rectangles
+        finite = eff[np.isfinite(eff)]
+        vmax = finite.max() if finite.size and finite.max() > 0 else 1.0
+        cols = np.round(np.nan_to_num(eff / vmax, nan=0.0, posinf=1.0, neginf=0.0) * BAR_RASTER_WIDTH)
+        img = np.zeros((k, BAR_ROWS, BAR_RASTER_WIDTH, 4), dtype=np.uint8)
+        fill = np.arange(BAR_RASTER_WIDTH) < cols[:, None]
+        img[:, 1:-1] = np.where(fill[:, None, :, None], _RDYLGN_U8[shades][:, None, None, :], 0)
+        img[:, 1:-1, :, 3] = np.where(fill[:, None, :], round(0.85 * 255), 0)
+        if k:
+            ax.imshow(img.reshape(k * BAR_ROWS, BAR_RASTER_WIDTH, 4), origin='lower', aspect='auto',
+                      interpolation='nearest', extent=(0, vmax, -0.5, k - 0.5), zorder=1)
+        ax.set_yticks(np.arange(k), names)
+        
+        ax.set_title('⚡ Appliance Efficiency Rating (Cost per kWh)', fontproperties=self._title_fp, pad=30)
+        ax.set_xlabel('Cost per kWh (₹)', fontproperties=self._axis_label_fp)
+        ax.set_ylabel('Appliance', fontproperties=self._axis_label_fp)
         ax.grid(True, alpha=0.3, axis='x', linestyle='--', linewidth=1.5)
         
-        # Add value labels
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            total_kwh = df.iloc[i]['total_kwh']
-            total_cost = df.iloc[i]['total_cost']
-            ax.text(width + 0.02, bar.get_y() + bar.get_height()/2,
-                   f'₹{width:.2f}/kWh\n({total_kwh:.1f} kWh, ₹{total_cost:.1f})',
-                   ha='left', va='center', fontsize=14, fontweight='bold',
-                   bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=0.9, 
-                            edgecolor=colors[i], linewidth=2))
-        
-        plt.tight_layout()
-        return self._save_figure(fig, save_as, return_base64)
+        # Add value labels (leave headroom so they stay on canvas); limits match
+        # 0.8-high bars with the default 5% y margin
+        pad = 0.05 * (k - 0.2)
+        ax.set_xlim(0, vmax * 1.3)
+        ax.set_ylim(-0.4 - pad, k - 0.6 + pad)
+        label_x = eff + 0.02
+        label_y = np.arange(k)
+        # Format all labels in three batched passes (np.char.mod returns a
+        # non-string array for empty input, hence the guard)
+        labels = []
+        if k:
+            labels = np.char.add(np.char.add(np.char.mod('₹%.2f/kWh\n(', eff), np.char.mod('%.1f kWh, ₹', kwh)),
+                                 np.char.mod('%.1f)', cost)).tolist()
+        for x, y, label, color in zip(label_x, label_y, labels, colors):
+            ax.add_artist(Text(x, y, label,
+                               ha='left', va='center', fontproperties=self._value_fp, clip_on=False,
+                               bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=0.9, 
+                                         edgecolor=color, linewidth=2)))
+        
+        return self._save_figure(fig, save_as, return_base64, dpi)
     
-    def plot_appliance_usage_timeline(self, timeline_data, save_as='appliance_timeline.png', return_base64=False):
+    @_memoized_render
+    @_energy_style
+    def plot_appliance_usage_timeline(self, timeline_data, save_as='appliance_timeline.png', return_base64=False, dpi=None):
         """
         Plot appliance usage over time (stacked area chart)
         
@@ -751,6 +1625,7 @@ class EnergyVisualizer:
             timeline_data: DataFrame with columns: date, appliance_name, kwh
             save_as: Output filename
             return_base64: Return as base64 string
+            dpi: Output resolution (defaults to 72 for base64, 100 for files)
         """
         # Pivot data for stacked area chart
         pivot_data = timeline_data.pivot_table(
@@ -760,10 +1635,10 @@ class EnergyVisualizer:
             aggfunc='sum'
         ).fillna(0)
         
-        fig, ax = plt.subplots(figsize=(18, 10))
+        fig, ax = self._acquire_fig('appliance_usage_timeline', (18, 10))
         
         # Create color palette
-        colors = plt.cm.Set3(np.linspace(0, 1, len(pivot_data.columns)))
+        colors = colormaps['Set3'](np.linspace(0, 1, len(pivot_data.columns)))
         
         # Create stacked area chart
         ax.stackplot(pivot_data.index, 
@@ -774,17 +1649,16 @@ class EnergyVisualizer:
                     edgecolor='white',
                     linewidth=2)
         
-        ax.set_title('📊 Appliance Usage Timeline (Stacked)', fontsize=28, fontweight='bold', pad=30)
-        ax.set_xlabel('Date', fontsize=22, fontweight='bold')
-        ax.set_ylabel('Energy Consumption (kWh)', fontsize=22, fontweight='bold')
+        ax.set_title('📊 Appliance Usage Timeline (Stacked)', fontproperties=self._title_fp, pad=30)
+        ax.set_xlabel('Date', fontproperties=self._axis_label_fp)
+        ax.set_ylabel('Energy Consumption (kWh)', fontproperties=self._axis_label_fp)
         ax.tick_params(axis='both', labelsize=16)
         ax.grid(True, alpha=0.3, axis='y', linestyle='--', linewidth=1.5)
         
         # Format x-axis dates
-        import matplotlib.dates as mdates
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %d'))
         ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(pivot_data) // 7)))
-        plt.xticks(rotation=45, ha='right')
+        setp(ax.get_xticklabels(), rotation=45, ha='right')
         
         # Add legend
         ax.legend(loc='upper left', fontsize=16, framealpha=0.95, 
@@ -813,12 +1687,44 @@ class EnergyVisualizer:
         ax.text(0.02, 0.98, stats_text, transform=ax.transAxes,
                fontsize=17, verticalalignment='top', bbox=props, fontweight='bold')
         
-        plt.tight_layout()
-        return self._save_figure(fig, save_as, return_base64)
+        return self._save_figure(fig, save_as, return_base64, dpi)
+
+
+# async_<plot> variants of every plot method, queued on the render thread
+def _async_plot(name):
+    """Build an async_<name> method that queues name through submit_plot"""
+    def submit(self, *args, **kwargs):
+        return self.submit_plot(name, *args, **kwargs)
+    
+    submit.__name__ = f'async_{name}'
+    submit.__doc__ = f"Queue {name} on the render thread and return a Future"
+    return submit
+
+
+for _name in [n for n in vars(EnergyVisualizer) if n.startswith('plot_') or n == 'create_dashboard_summary']:
+    setattr(EnergyVisualizer, f'async_{_name}', _async_plot(_name))
+
+
+# Visualizer owned by a render_dashboard worker process
+_worker_visualizer = None
+
+
+def _init_worker():
+    """Give a render_dashboard worker its own unlocked render lock"""
+    EnergyVisualizer._render_lock = threading.Lock()
+
+
+def _render_task(output_dir, method_name, args, kwargs):
+    """Run one render_dashboard job in a worker process and return its base64 image"""
+    global _worker_visualizer
+    if _worker_visualizer is None or _worker_visualizer.output_dir != output_dir:
+        _worker_visualizer = EnergyVisualizer(output_dir=output_dir)
+    return getattr(_worker_visualizer, method_name)(*args, return_base64=True, **kwargs)
 
 
 # Example usage
-if __name__ == "__main__":
+def _demo():
+    """Render sample plots into ./plots"""
     # Create sample data
     dates = pd.date_range(start='2024-09-01', end='2024-10-10', freq='D')
     daily_data = pd.DataFrame({
@@ -842,3 +1748,7 @@ if __name__ == "__main__":
     viz.plot_appliance_breakdown(appliance_data)
     
     print("Visualizations created successfully!")
+
+
+if __name__ == "__main__":
+    _demo()